@@ -14,6 +14,8 @@ Configuration:
     {
         "window_titles": ["Window Title 1", "Window Title 2"]
     }
+
+    Pass --debug to also log every black bars state change.
 """
 
 from __future__ import annotations
@@ -34,6 +36,7 @@ import win32api
 import win32con
 import win32event
 import win32gui
+import win32process
 import winerror
 from PIL import Image, ImageDraw
 
@@ -42,31 +45,148 @@ from PIL import Image, ImageDraw
 WINDOW_TITLES = [
     "League of Legends (TM) Client",
 ]
+# Hashed copy of WINDOW_TITLES for O(1) lookups on the hook path
+WINDOW_TITLE_SET = frozenset(WINDOW_TITLES)
+# Shortest monitored title, used to reject short titles without fetching them
+WINDOW_TITLE_MIN_LENGTH = min((len(title) for title in WINDOW_TITLES), default=0)
 CONFIG_FILE = Path("snickers.json")
 TASKBAR_CLASS = "Shell_TrayWnd"
 START_BUTTON_CLASS = "Button"
 
 # Windows Event Constants
 EVENT_SYSTEM_FOREGROUND = 0x0003  # Foreground window changed
+EVENT_SYSTEM_MOVESIZEEND = 0x000B  # Window finished moving or resizing
 EVENT_OBJECT_REORDER = 0x8004  # Z-order changed
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B  # Window moved or resized
+EVENT_OBJECT_NAMECHANGE = 0x800C  # Window title changed
 EVENT_SYSTEM_MINIMIZESTART = 0x0016  # Window minimized
 EVENT_SYSTEM_MINIMIZEEND = 0x0017  # Window restored from minimized
 WINEVENT_OUTOFCONTEXT = 0x0000  # Events delivered async, no hook injection
+WINEVENT_SKIPOWNPROCESS = 0x0002  # Ignore events raised by our own windows
+OBJID_WINDOW = 0  # Event refers to the window itself, not a child object
+
+# Bursts of hook events (e.g. fast Alt+Tab) are coalesced into a single state check
+STATE_CHECK_TIMER_ID = 1
+STATE_CHECK_DELAY_MS = 25
+
+# Events that can change the black bars state. The foreground/minimize hook covers
+# the whole 0x0003-0x0017 range, which also delivers menu, capture, drag, scroll and
+# other events we don't care about.
+STATE_EVENTS = frozenset(
+    (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_MINIMIZESTART, EVENT_SYSTEM_MINIMIZEEND)
+)
+
+user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+
+# Define the callback type for SetWinEventHook
+# WINEVENTPROC: void callback(HWINEVENTHOOK, DWORD, HWND, LONG, LONG, DWORD, DWORD)
+WinEventProcType = ctypes.WINFUNCTYPE(  # type: ignore[attr-defined]
+    None,
+    ctypes.wintypes.HANDLE,  # hWinEventHook
+    ctypes.wintypes.DWORD,  # event
+    ctypes.wintypes.HWND,  # hwnd
+    ctypes.wintypes.LONG,  # idObject
+    ctypes.wintypes.LONG,  # idChild
+    ctypes.wintypes.DWORD,  # idEventThread
+    ctypes.wintypes.DWORD,  # dwmsEventTime
+)
+
+# Declare the hook signatures so 64-bit hook handles are not truncated to a C int
+user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+user32.SetWinEventHook.argtypes = [
+    ctypes.wintypes.DWORD,  # eventMin
+    ctypes.wintypes.DWORD,  # eventMax
+    ctypes.wintypes.HMODULE,  # hmodWinEventProc
+    WinEventProcType,  # pfnWinEventProc
+    ctypes.wintypes.DWORD,  # idProcess
+    ctypes.wintypes.DWORD,  # idThread
+    ctypes.wintypes.DWORD,  # dwFlags
+]
+user32.UnhookWinEvent.restype = ctypes.wintypes.BOOL
+user32.UnhookWinEvent.argtypes = [ctypes.wintypes.HANDLE]
+
+# Call the hot-path user32 functions through ctypes directly, skipping the
+# pywin32 conversion layer on every hook event
+user32.GetForegroundWindow.restype = ctypes.wintypes.HWND
+user32.GetForegroundWindow.argtypes = []
+user32.IsIconic.restype = ctypes.wintypes.BOOL
+user32.IsIconic.argtypes = [ctypes.wintypes.HWND]
+user32.GetWindowTextLengthW.restype = ctypes.c_int
+user32.GetWindowTextLengthW.argtypes = [ctypes.wintypes.HWND]
+user32.GetWindowTextW.restype = ctypes.c_int
+user32.GetWindowTextW.argtypes = [
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.LPWSTR,
+    ctypes.c_int,
+]
+
+# Debounce timer on the black window
+user32.SetTimer.restype = ctypes.c_size_t
+user32.SetTimer.argtypes = [
+    ctypes.wintypes.HWND,
+    ctypes.c_size_t,
+    ctypes.wintypes.UINT,
+    ctypes.c_void_p,
+]
+user32.KillTimer.restype = ctypes.wintypes.BOOL
+user32.KillTimer.argtypes = [ctypes.wintypes.HWND, ctypes.c_size_t]
+
+
+class BlackBarsState:
+    """Black bars state and cached window handles.
+
+    ``active``, ``monitored_hwnd`` and ``rect`` change together in activate/deactivate
+    and cleanup(); the remaining fields are caches, updated wherever they are looked
+    up. No locking: hook callbacks, window procedures and cleanup() all run on the
+    main thread. SetWindowPos/ShowWindow can dispatch messages back into our
+    handlers, so activate/deactivate flip ``active`` before touching any window to
+    make nested calls return early.
+    """
+
+    __slots__ = (
+        "active",
+        "hwnd",
+        "monitored_hwnd",
+        "rect",
+        "matched_hwnd",
+        "monitor_rects",
+        "pending_foreground",
+        "check_pending",
+        "location_hook",
+        "taskbar_hwnd",
+        "start_hwnd",
+    )
+
+    def __init__(self) -> None:
+        self.active = False
+        self.hwnd: int | None = None  # Black background window
+        self.monitored_hwnd: int | None = None  # Window the bars are shown for
+        self.rect: tuple[int, int, int, int] | None = None  # Monitor being covered
+        self.matched_hwnd: int | None = None  # Last window whose title matched
+        self.monitor_rects: dict[int, tuple[int, int, int, int]] = {}  # By window
+        self.pending_foreground: int | None = None  # Foreground from debounced events
+        self.check_pending = False  # Debounce timer is armed
+        self.location_hook: int | None = None  # Hook following the monitored window
+        self.taskbar_hwnd: int | None = None
+        self.start_hwnd: int | None = None
+
 
 # Global state
-black_window_hwnd: int | None = None
-black_bars_active: bool = False
+state = BlackBarsState()
 hook_handles: list[int] = []
 tray_icon: pystray.Icon | None = None
 shutting_down: bool = False
 singleton_mutex: Any = None
+shutdown_event: Any = None
 
 # =============================================================================
 # Logging
 # =============================================================================
 
 log = logging.getLogger("snickers")
-log.setLevel(logging.DEBUG)
+# INFO by default so state changes on the focus-change path don't produce any I/O;
+# main() switches to DEBUG when --debug is passed
+log.setLevel(logging.INFO)
 
 # Create formatters
 formatter = logging.Formatter(
@@ -99,7 +219,7 @@ logger = log
 
 def load_config() -> None:
     """Load configuration from file or command-line arguments."""
-    global WINDOW_TITLES
+    global WINDOW_TITLES, WINDOW_TITLE_SET, WINDOW_TITLE_MIN_LENGTH
 
     # Check for config file
     if CONFIG_FILE.exists():
@@ -131,36 +251,71 @@ def load_config() -> None:
                 f"Loaded {len(WINDOW_TITLES)} window titles from command-line arguments"
             )
 
+    WINDOW_TITLE_SET = frozenset(WINDOW_TITLES)
+    WINDOW_TITLE_MIN_LENGTH = min((len(title) for title in WINDOW_TITLES), default=0)
+
 
 # =============================================================================
 # Window Detection
 # =============================================================================
 
 
+# Reused for every title lookup. Only touched from the main thread.
+WINDOW_TITLE_BUFFER_SIZE = 256
+_window_title_buffer = ctypes.create_unicode_buffer(WINDOW_TITLE_BUFFER_SIZE)
+
+
 def get_foreground_window() -> int:
     """Get the handle of the currently focused window."""
-    return win32gui.GetForegroundWindow()
+    return user32.GetForegroundWindow() or 0
 
 
 def get_window_title(hwnd: int) -> str:
     """Get the title of a window by its handle."""
-    try:
-        return win32gui.GetWindowText(hwnd)
-    except Exception:
-        return ""
+    length = user32.GetWindowTextW(
+        hwnd, _window_title_buffer, WINDOW_TITLE_BUFFER_SIZE
+    )
+    if length < WINDOW_TITLE_BUFFER_SIZE - 1:
+        return _window_title_buffer[:length]
+
+    # The title filled the shared buffer and may be truncated; fetch it in full
+    size = user32.GetWindowTextLengthW(hwnd) + 1
+    buffer = ctypes.create_unicode_buffer(size)
+    length = user32.GetWindowTextW(hwnd, buffer, size)
+    return buffer[:length]
 
 
 def is_window_minimized(hwnd: int) -> bool:
     """Check if a window is minimized."""
-    try:
-        return bool(win32gui.IsIconic(hwnd))
-    except Exception:
-        return False
+    return bool(user32.IsIconic(hwnd))
 
 
 def is_monitored_window(hwnd: int) -> bool:
-    """Check if the given window handle is one of the monitored windows."""
-    return get_window_title(hwnd) in WINDOW_TITLES
+    """Check if the given window handle is one of the monitored windows.
+
+    The last matching handle is cached so repeated checks against the same window
+    are a plain integer compare instead of a cross-process GetWindowText call.
+    Title changes are only watched while the black bars are active, so the cache is
+    only kept while they are: it is dropped on a title change, and by
+    check_and_update_state() whenever the bars end up inactive.
+    """
+    if hwnd and hwnd == state.matched_hwnd:
+        return True
+
+    # Drop the cached handle once its window is gone, so a reused handle can't match
+    if state.matched_hwnd is not None and not win32gui.IsWindow(state.matched_hwnd):
+        state.monitor_rects.pop(state.matched_hwnd, None)
+        state.matched_hwnd = None
+
+    # Cheap length check first. GetWindowTextLengthW may report more than the real
+    # length (e.g. ANSI windows with DBCS characters), so it is only a lower bound.
+    if user32.GetWindowTextLengthW(hwnd) < WINDOW_TITLE_MIN_LENGTH:
+        return False
+
+    if get_window_title(hwnd) in WINDOW_TITLE_SET:
+        state.matched_hwnd = hwnd
+        return True
+    return False
 
 
 # =============================================================================
@@ -181,12 +336,20 @@ def get_monitor_info(hwnd: int) -> Any:
 def get_monitor_rect(hwnd: int) -> tuple[int, int, int, int] | None:
     """Get the full screen rectangle of the monitor containing the window.
 
+    Results are cached per window until it is moved or the display layout changes.
+
     Returns (left, top, right, bottom) or None if unable to determine.
     """
+    cached = state.monitor_rects.get(hwnd)
+    if cached is not None:
+        return cached
+
     monitor_info = get_monitor_info(hwnd)
     if monitor_info:
         # Use 'Monitor' rect (full screen) instead of 'Work' rect (excludes taskbar)
-        return monitor_info["Monitor"]
+        monitor_rect = monitor_info["Monitor"]
+        state.monitor_rects[hwnd] = monitor_rect
+        return monitor_rect
     return None
 
 
@@ -195,6 +358,58 @@ def get_monitor_rect(hwnd: int) -> tuple[int, int, int, int] | None:
 # =============================================================================
 
 
+def on_black_window_activate(hwnd: int, msg: int, wparam: int, lparam: int) -> int:
+    """Handle WM_ACTIVATE for the black window.
+
+    The window is created with WS_EX_NOACTIVATE, but if it still ends up active
+    (e.g. when Windows picks it as the next window to activate after another one
+    closes) hand focus straight back to the monitored window so the black bars
+    don't switch themselves off.
+    """
+    if win32api.LOWORD(wparam) != win32con.WA_INACTIVE:
+        monitored_hwnd = state.monitored_hwnd
+        if state.active and monitored_hwnd:
+            try:
+                win32gui.SetForegroundWindow(monitored_hwnd)
+            except Exception:
+                pass
+    return 0
+
+
+def on_black_window_activate_app(
+    hwnd: int, msg: int, wparam: int, lparam: int
+) -> int:
+    """Handle WM_ACTIVATEAPP for the black window.
+
+    The event hooks skip our own process, so re-check the state when our thread
+    gains activation instead. Activation of the black window itself is left to
+    on_black_window_activate, which hands focus back to the monitored window.
+    """
+    if wparam and not shutting_down and get_foreground_window() != state.hwnd:
+        schedule_state_check()
+    return 0
+
+
+def on_black_window_display_change(
+    hwnd: int, msg: int, wparam: int, lparam: int
+) -> int:
+    """Handle WM_DISPLAYCHANGE by forgetting all cached monitor rectangles."""
+    state.monitor_rects.clear()
+    return 0
+
+
+def on_black_window_timer(hwnd: int, msg: int, wparam: int, lparam: int) -> int:
+    """Handle WM_TIMER for the black window by running the deferred state check."""
+    if wparam == STATE_CHECK_TIMER_ID:
+        user32.KillTimer(hwnd, STATE_CHECK_TIMER_ID)
+        state.check_pending = False
+        foreground_hwnd = state.pending_foreground
+        state.pending_foreground = None
+        if not shutting_down:
+            check_and_update_state(foreground_hwnd)
+    return 0
+
+
 def create_window_class() -> str:
     """Register a window class for the black background window."""
     class_name = "SnickersWindow"
@@ -205,31 +420,32 @@ def create_window_class() -> str:
         msg,
         wparam,
         lparam: ctypes.windll.user32.PostQuitMessage(0),  # type: ignore[attr-defined]
+        win32con.WM_ACTIVATE: on_black_window_activate,
+        win32con.WM_ACTIVATEAPP: on_black_window_activate_app,
+        win32con.WM_DISPLAYCHANGE: on_black_window_display_change,
+        win32con.WM_TIMER: on_black_window_timer,
     }
     wc.lpszClassName = class_name  # type: ignore[assignment]
     wc.hbrBackground = win32gui.GetStockObject(win32con.BLACK_BRUSH)  # type: ignore[assignment]
     wc.hCursor = win32gui.LoadCursor(0, win32con.IDC_ARROW)  # type: ignore[assignment]
 
-    try:
-        win32gui.RegisterClass(wc)
-    except Exception:
-        # Class may already be registered
-        pass
+    win32gui.RegisterClass(wc)
 
     return class_name
 
 
-def create_black_window(monitor_rect: tuple[int, int, int, int]) -> int:
+def create_black_window(
+    class_name: str, monitor_rect: tuple[int, int, int, int]
+) -> int:
     """Create a fullscreen black window on the specified monitor.
 
     Args:
+        class_name: Window class registered by create_window_class()
         monitor_rect: (left, top, right, bottom) coordinates of the monitor
 
     Returns:
         Window handle of the created window
     """
-    class_name = create_window_class()
-
     left, top, right, bottom = monitor_rect
     width = right - left
     height = bottom - top
@@ -271,21 +487,25 @@ def create_black_window(monitor_rect: tuple[int, int, int, int]) -> int:
     return hwnd
 
 
-def show_black_window(hwnd: int, monitored_hwnd: int) -> None:
-    """Show the black window and position it just below the monitored window in z-order."""
+def show_black_window(
+    hwnd: int, monitored_hwnd: int, monitor_rect: tuple[int, int, int, int]
+) -> None:
+    """Cover the given monitor with the black window, just below the monitored window.
+
+    Moving, resizing, reordering and showing are done in a single SetWindowPos call.
+    """
+    left, top, right, bottom = monitor_rect
+
     # Position the black window just below the monitored window in the z-order
     # This ensures it's behind the monitored window but in front of everything else
     win32gui.SetWindowPos(
         hwnd,
         monitored_hwnd,  # Insert after (below) monitored window
-        0,
-        0,
-        0,
-        0,
-        win32con.SWP_NOMOVE
-        | win32con.SWP_NOSIZE
-        | win32con.SWP_NOACTIVATE
-        | win32con.SWP_SHOWWINDOW,
+        left,
+        top,
+        right - left,
+        bottom - top,
+        win32con.SWP_NOACTIVATE | win32con.SWP_SHOWWINDOW,
     )
 
 
@@ -310,6 +530,12 @@ def destroy_black_window(hwnd: int) -> None:
 # =============================================================================
 
 
+# The taskbar is hidden with ShowWindow rather than SHAppBarMessage(ABM_SETSTATE):
+# switching to auto-hide changes the user's persistent setting and the desktop work
+# area, which resizes every maximized window (including a maximized-windowed game)
+# on each toggle. A hidden taskbar comes back by itself when Explorer restarts.
+
+
 def find_taskbar() -> int | None:
     """Find the Windows taskbar window handle."""
     return win32gui.FindWindow(TASKBAR_CLASS, None) or None
@@ -317,34 +543,45 @@ def find_taskbar() -> int | None:
 
 def find_start_button() -> int | None:
     """Find the Windows Start button window handle."""
-    taskbar = find_taskbar()
-    if taskbar:
-        # The Start button is usually a child or nearby window
-        start = win32gui.FindWindowEx(0, 0, START_BUTTON_CLASS, "Start")
-        return start or None
-    return None
+    # The Start button is usually a child or nearby window
+    return win32gui.FindWindowEx(0, 0, START_BUTTON_CLASS, "Start") or None
+
+
+def resolve_taskbar_handles() -> None:
+    """Look up the taskbar and Start button handles and cache them."""
+    state.taskbar_hwnd = find_taskbar()
+    state.start_hwnd = find_start_button() if state.taskbar_hwnd else None
+
+
+def get_taskbar_handles() -> tuple[int | None, int | None]:
+    """Return the cached taskbar and Start button handles.
+
+    The handles stay valid for the whole session unless explorer.exe restarts,
+    so they are only looked up again once the cached taskbar window is gone.
+    """
+    if not state.taskbar_hwnd or not win32gui.IsWindow(state.taskbar_hwnd):
+        resolve_taskbar_handles()
+    return state.taskbar_hwnd, state.start_hwnd
 
 
 def hide_taskbar() -> None:
     """Hide the Windows taskbar."""
-    taskbar = find_taskbar()
+    taskbar, start = get_taskbar_handles()
     if taskbar:
         win32gui.ShowWindow(taskbar, win32con.SW_HIDE)
 
     # Also try to hide the Start button (Windows 10+)
-    start = find_start_button()
     if start:
         win32gui.ShowWindow(start, win32con.SW_HIDE)
 
 
 def show_taskbar() -> None:
     """Show the Windows taskbar."""
-    taskbar = find_taskbar()
+    taskbar, start = get_taskbar_handles()
     if taskbar:
         win32gui.ShowWindow(taskbar, win32con.SW_SHOW)
 
     # Also restore the Start button
-    start = find_start_button()
     if start:
         win32gui.ShowWindow(start, win32con.SW_SHOW)
 
@@ -355,45 +592,75 @@ def show_taskbar() -> None:
 
 
 def activate_black_bars(monitored_hwnd: int) -> None:
-    """Activate black bars mode for the given monitored window."""
-    global black_window_hwnd, black_bars_active
+    """Activate black bars mode for the given monitored window.
+
+    If the bars are already active for another monitored window, they are moved
+    over to this one.
+    """
+    if state.active and state.monitored_hwnd == monitored_hwnd:
+        return
 
     # Get the monitor where the window is displayed
     monitor_rect = get_monitor_rect(monitored_hwnd)
     if not monitor_rect:
         window_title = get_window_title(monitored_hwnd)
         logger.warning(f"Could not determine monitor for window: '{window_title}'")
+        # Don't leave the bars behind on the previously monitored window
+        deactivate_black_bars()
         return
 
-    # Create and show the black background window
-    if black_window_hwnd is None:
-        black_window_hwnd = create_black_window(monitor_rect)
+    # The black window is created hidden at startup; move it onto the monitor
+    # and show it
+    if state.hwnd is None:
+        logger.warning("Black window has not been created")
+        return
+
+    # Mark active before touching any window, so a nested call returns early
+    state.active = True
+    state.monitored_hwnd = monitored_hwnd
+    state.rect = monitor_rect
 
-    show_black_window(black_window_hwnd, monitored_hwnd)
+    show_black_window(state.hwnd, monitored_hwnd, monitor_rect)
     hide_taskbar()
-    black_bars_active = True
-    window_title = get_window_title(monitored_hwnd)
-    logger.debug(
-        f"Black bars activated for window: '{window_title}' on monitor: {monitor_rect}"
-    )
+
+    # Follow the window if it is moved to another monitor while active
+    install_location_hook(monitored_hwnd)
+
+    # Skip the extra title lookup unless debug logging is actually enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        window_title = get_window_title(monitored_hwnd)
+        logger.debug(
+            f"Black bars activated for window: '{window_title}' on monitor: {monitor_rect}"
+        )
 
 
 def deactivate_black_bars() -> None:
     """Deactivate black bars mode."""
-    global black_window_hwnd, black_bars_active
+    if not state.active:
+        return
+
+    state.active = False
+    state.monitored_hwnd = None
+    state.rect = None
+
+    # Title changes are only tracked while active, so re-read it next time.
+    # Closing the window also lands here, so forget its monitor rect if it's gone.
+    if state.matched_hwnd is not None and not win32gui.IsWindow(state.matched_hwnd):
+        state.monitor_rects.pop(state.matched_hwnd, None)
+    state.matched_hwnd = None
+
+    uninstall_location_hook()
 
-    if black_window_hwnd:
-        hide_black_window(black_window_hwnd)
+    if state.hwnd:
+        hide_black_window(state.hwnd)
 
     show_taskbar()
-    black_bars_active = False
     logger.debug("Black bars deactivated")
 
 
 def ensure_black_window_z_order(monitored_hwnd: int) -> None:
     """Ensure the black window is positioned directly below the monitored window in z-order."""
-    global black_window_hwnd
-
+    black_window_hwnd = state.hwnd
     if black_window_hwnd is None:
         return
 
@@ -416,40 +683,72 @@ def ensure_black_window_z_order(monitored_hwnd: int) -> None:
         pass
 
 
-def check_and_update_state() -> None:
-    """Check the current foreground window and update black bars state accordingly."""
-    foreground_hwnd = get_foreground_window()
+def check_and_update_state(foreground_hwnd: int | None = None) -> None:
+    """Check the current foreground window and update black bars state accordingly.
+
+    Args:
+        foreground_hwnd: The new foreground window if already known (e.g. from an
+            EVENT_SYSTEM_FOREGROUND event); looked up with GetForegroundWindow otherwise
+    """
+    if not foreground_hwnd:
+        foreground_hwnd = get_foreground_window()
 
     if is_monitored_window(foreground_hwnd) and not is_window_minimized(
         foreground_hwnd
     ):
-        if not black_bars_active:
+        if not state.active or foreground_hwnd != state.monitored_hwnd:
+            # Not active yet, or focus moved straight to another monitored window
             activate_black_bars(foreground_hwnd)
         else:
             # Black bars already active - ensure z-order is correct
             ensure_black_window_z_order(foreground_hwnd)
     else:
-        if black_bars_active:
+        if state.active:
             deactivate_black_bars()
 
+    # A match that didn't lead to active bars (minimized window, unknown monitor) has
+    # no title change hook watching it, so don't keep trusting it
+    if not state.active:
+        state.matched_hwnd = None
+
+
+def schedule_state_check(
+    foreground_hwnd: int | None = None, restart: bool = True
+) -> None:
+    """Run check_and_update_state once the current burst of events has settled.
+
+    Foreground and minimize events restart the timer on the black window, so only
+    the last event of a burst leads to an actual check.
+
+    Args:
+        foreground_hwnd: The new foreground window, if the event reported one
+        restart: Whether to restart an already pending timer. Pass False for
+            events that can arrive in a steady stream (system-wide z-order
+            changes, title updates), so they can't postpone the check forever.
+    """
+    if foreground_hwnd:
+        state.pending_foreground = foreground_hwnd
+
+    if state.check_pending and not restart:
+        return
+
+    if state.hwnd is None or not user32.SetTimer(
+        state.hwnd, STATE_CHECK_TIMER_ID, STATE_CHECK_DELAY_MS, None
+    ):
+        # No timer available, check right away
+        state.check_pending = False
+        foreground_hwnd = state.pending_foreground
+        state.pending_foreground = None
+        check_and_update_state(foreground_hwnd)
+        return
+
+    state.check_pending = True
+
 
 # =============================================================================
 # Windows Event Hook
 # =============================================================================
 
-# Define the callback type for SetWinEventHook
-# WINEVENTPROC: void callback(HWINEVENTHOOK, DWORD, HWND, LONG, LONG, DWORD, DWORD)
-WinEventProcType = ctypes.WINFUNCTYPE(  # type: ignore[attr-defined]
-    None,
-    ctypes.wintypes.HANDLE,  # hWinEventHook
-    ctypes.wintypes.DWORD,  # event
-    ctypes.wintypes.HWND,  # hwnd
-    ctypes.wintypes.LONG,  # idObject
-    ctypes.wintypes.LONG,  # idChild
-    ctypes.wintypes.DWORD,  # idEventThread
-    ctypes.wintypes.DWORD,  # dwmsEventTime
-)
-
 
 def win_event_callback(
     hWinEventHook: int,
@@ -468,9 +767,25 @@ def win_event_callback(
     if shutting_down:
         return
 
+    # A moved window may now be on another monitor
+    if event == EVENT_SYSTEM_MOVESIZEEND:
+        state.monitor_rects.pop(hwnd, None)
+        return
+
+    # Drop unrelated events before touching any win32 API. Z-order changes only
+    # matter while the black window has to be kept below the monitored window.
+    if event not in STATE_EVENTS and not (
+        event == EVENT_OBJECT_REORDER and state.active
+    ):
+        return
+
     # We handle all relevant events by checking the current state
-    # This is simpler and more robust than trying to track specific window events
-    check_and_update_state()
+    # This is simpler and more robust than trying to track specific window events.
+    # Foreground events already carry the new foreground window, so reuse it.
+    if event == EVENT_SYSTEM_FOREGROUND and idObject == OBJID_WINDOW:
+        schedule_state_check(hwnd)
+    else:
+        schedule_state_check(restart=event in STATE_EVENTS)
 
 
 # Keep a reference to prevent garbage collection
@@ -480,22 +795,24 @@ _win_event_callback = WinEventProcType(win_event_callback)
 def install_event_hooks() -> list[int]:
     """Install Windows event hooks for foreground changes, minimize events, and z-order changes.
 
+    Events are delivered through the message queue of the calling thread, so that
+    thread must run a message loop.
+
     Returns a list of hook handles (empty if all failed).
     """
-    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
     hooks = []
 
     # Hook 1: Foreground and minimize events (0x0003 to 0x0017)
     hook1 = user32.SetWinEventHook(
         EVENT_SYSTEM_FOREGROUND,  # eventMin
         EVENT_SYSTEM_MINIMIZEEND,  # eventMax
-        0,  # hmodWinEventProc (0 for out-of-context)
+        None,  # hmodWinEventProc (None for out-of-context)
         _win_event_callback,  # lpfnWinEventProc
         0,  # idProcess (0 = all processes)
         0,  # idThread (0 = all threads)
-        WINEVENT_OUTOFCONTEXT,  # dwFlags
+        WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,  # dwFlags
     )
-    if hook1 != 0:
+    if hook1:
         hooks.append(hook1)
 
     # Hook 2: Z-order reorder events (0x8004)
@@ -503,13 +820,13 @@ def install_event_hooks() -> list[int]:
     hook2 = user32.SetWinEventHook(
         EVENT_OBJECT_REORDER,  # eventMin
         EVENT_OBJECT_REORDER,  # eventMax
-        0,  # hmodWinEventProc (0 for out-of-context)
+        None,  # hmodWinEventProc (None for out-of-context)
         _win_event_callback,  # lpfnWinEventProc
         0,  # idProcess (0 = all processes)
         0,  # idThread (0 = all threads)
-        WINEVENT_OUTOFCONTEXT,  # dwFlags
+        WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,  # dwFlags
     )
-    if hook2 != 0:
+    if hook2:
         hooks.append(hook2)
 
     return hooks
@@ -517,11 +834,82 @@ def install_event_hooks() -> list[int]:
 
 def uninstall_event_hooks(hooks: list[int]) -> None:
     """Uninstall all Windows event hooks."""
-    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
     for hook in hooks:
         user32.UnhookWinEvent(hook)
 
 
+def location_change_callback(
+    hWinEventHook: int,
+    event: int,
+    hwnd: int,
+    idObject: int,
+    idChild: int,
+    idEventThread: int,
+    dwmsEventTime: int,
+) -> None:
+    """Callback for location and title changes of the monitored window's process.
+
+    Moves the black window along when the monitored window lands on another monitor,
+    and re-checks the state when its title changes.
+    """
+    if shutting_down or idObject != OBJID_WINDOW:
+        return
+
+    # The title may no longer match, so drop the cached match and check again
+    if event == EVENT_OBJECT_NAMECHANGE:
+        if hwnd == state.matched_hwnd:
+            state.matched_hwnd = None
+            schedule_state_check(restart=False)
+        return
+
+    if not state.active or state.hwnd is None or hwnd != state.monitored_hwnd:
+        return
+
+    state.monitor_rects.pop(hwnd, None)
+    monitor_rect = get_monitor_rect(hwnd)
+    if monitor_rect and monitor_rect != state.rect:
+        state.rect = monitor_rect
+        show_black_window(state.hwnd, hwnd, monitor_rect)
+        logger.debug(f"Black bars moved to monitor: {monitor_rect}")
+
+
+# Keep a reference to prevent garbage collection
+_location_change_callback = WinEventProcType(location_change_callback)
+
+
+def install_location_hook(monitored_hwnd: int) -> None:
+    """Watch location and title changes, limited to the monitored window's process.
+
+    A global EVENT_OBJECT_LOCATIONCHANGE hook fires for every caret and cursor
+    movement, so the hook is scoped to one process and only lives while active.
+    """
+    uninstall_location_hook()
+    try:
+        _, pid = win32process.GetWindowThreadProcessId(monitored_hwnd)
+    except Exception:
+        return
+
+    state.location_hook = (
+        user32.SetWinEventHook(
+            EVENT_OBJECT_LOCATIONCHANGE,  # eventMin
+            EVENT_OBJECT_NAMECHANGE,  # eventMax
+            None,  # hmodWinEventProc (None for out-of-context)
+            _location_change_callback,  # lpfnWinEventProc
+            pid,  # idProcess (only the monitored window's process)
+            0,  # idThread (0 = all threads)
+            WINEVENT_OUTOFCONTEXT,  # dwFlags
+        )
+        or None
+    )
+
+
+def uninstall_location_hook() -> None:
+    """Remove the location change hook, if installed."""
+    if state.location_hook:
+        user32.UnhookWinEvent(state.location_hook)
+        state.location_hook = None
+
+
 # =============================================================================
 # System Tray Icon
 # =============================================================================
@@ -555,9 +943,8 @@ def create_tray_icon_image() -> Image.Image:
 
 def on_tray_quit(icon: pystray.Icon, item: pystray.MenuItem) -> None:
     """Handle quit action from the tray menu."""
-    global shutting_down
     icon.stop()
-    shutting_down = True
+    request_shutdown()
 
 
 def create_tray_menu() -> pystray.Menu:
@@ -613,7 +1000,7 @@ def run_tray_icon(icon: pystray.Icon) -> None:
 
 def cleanup() -> None:
     """Clean up resources and restore system state."""
-    global black_window_hwnd, hook_handles, tray_icon, singleton_mutex
+    global hook_handles, tray_icon, singleton_mutex
 
     logger.info("Cleaning up...")
 
@@ -638,27 +1025,51 @@ def cleanup() -> None:
         uninstall_event_hooks(hook_handles)
         hook_handles = []
 
+    state.active = False
+    state.monitored_hwnd = None
+    state.rect = None
+    uninstall_location_hook()
+
     # Always restore the taskbar
     show_taskbar()
 
     # Destroy the black window if it exists
-    if black_window_hwnd:
-        destroy_black_window(black_window_hwnd)
-        black_window_hwnd = None
+    if state.hwnd:
+        destroy_black_window(state.hwnd)
+        state.hwnd = None
 
     logger.info("Cleanup complete")
 
 
-def signal_handler(signum: int, frame: Any) -> None:
-    """Handle termination signals gracefully."""
+def request_shutdown() -> None:
+    """Stop the main message loop. Safe to call from any thread."""
     global shutting_down
     shutting_down = True
-    cleanup()
+    if shutdown_event:
+        win32event.SetEvent(shutdown_event)
+
+
+def signal_handler(signum: int, frame: Any) -> None:
+    """Handle termination signals gracefully."""
+    request_shutdown()
+
+
+def console_ctrl_handler(ctrl_type: int) -> bool:
+    """Handle Ctrl+C / Ctrl+Break while the main thread is blocked in the message loop.
+
+    Python signal handlers only run once the main thread executes bytecode again,
+    which never happens while it waits for messages, so wake it up from here.
+    """
+    if ctrl_type in (win32con.CTRL_C_EVENT, win32con.CTRL_BREAK_EVENT):
+        logger.info("Keyboard interrupt received")
+        request_shutdown()
+        return True
+    return False
 
 
 def main() -> None:
     """Main entry point."""
-    global hook_handles, tray_icon, shutting_down, WINDOW_TITLES, logger, singleton_mutex
+    global hook_handles, tray_icon, WINDOW_TITLES, logger, singleton_mutex, shutdown_event
 
     # Ensure only one instance is running
     mutex_name = "Snickers_SingleInstance_Mutex"
@@ -667,12 +1078,19 @@ def main() -> None:
         logger.warning("Another instance of Black Bars is already running. Exiting.")
         sys.exit(0)
 
+    if "--debug" in sys.argv:
+        log.setLevel(logging.DEBUG)
+
+    # Manual-reset event that wakes the message loop when shutdown is requested
+    shutdown_event = win32event.CreateEvent(None, True, False, None)
+
     # Load configuration
     load_config()
 
     # Set up signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
+    win32api.SetConsoleCtrlHandler(console_ctrl_handler, True)
 
     logger.info("Snickers Script (Event-Driven)")
     logger.info("=" * 50)
@@ -684,7 +1102,17 @@ def main() -> None:
     logger.info("Press Ctrl+C to exit")
     logger.info("=" * 50)
 
+    # Look up the taskbar once; hide/show reuse the cached handles
+    resolve_taskbar_handles()
+
     try:
+        # Register the black window class once, before any activation can happen
+        class_name = create_window_class()
+
+        # Create the black window up front (hidden) so activation only has to
+        # reposition and show it
+        state.hwnd = create_black_window(class_name, (0, 0, 1, 1))
+
         # Install the Windows event hooks
         hook_handles = install_event_hooks()
         if not hook_handles:
@@ -704,27 +1132,21 @@ def main() -> None:
         # Check initial state (in case a monitored window is already focused)
         check_and_update_state()
 
-        # Run a non-blocking message loop using PeekMessage
-        # This allows Ctrl+C to be processed properly
-        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
-        msg = ctypes.wintypes.MSG()
-
-        WM_QUIT = 0x0012
-
+        # Sleep until a message (hook events are delivered as messages) or the
+        # shutdown event arrives, so there is no idle wakeup and exit is immediate
         while not shutting_down:
-            # PeekMessage is non-blocking: returns 0 if no message, positive if message found
-            result = user32.PeekMessageW(ctypes.byref(msg), 0, 0, 0, 1)  # 1 = PM_REMOVE
-
-            if result > 0:
-                if msg.message == WM_QUIT:
-                    break
-                user32.TranslateMessage(ctypes.byref(msg))
-                user32.DispatchMessageW(ctypes.byref(msg))
-            else:
-                # No message - sleep briefly to avoid busy waiting
-                import time
-
-                time.sleep(0.01)
+            result = win32event.MsgWaitForMultipleObjects(
+                [shutdown_event],
+                False,
+                win32event.INFINITE,
+                win32event.QS_ALLINPUT,
+            )
+            if result == win32event.WAIT_OBJECT_0:
+                break
+
+            # PumpWaitingMessages returns non-zero once WM_QUIT is received
+            if win32gui.PumpWaitingMessages():
+                break
 
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")